@@ -7,7 +7,9 @@ from datetime import datetime
 from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
@@ -15,15 +17,16 @@ from dotenv import load_dotenv
 load_dotenv()
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
-from document_freshness_auditor.crew import DocumentFreshnessAuditor
 from document_freshness_auditor import db
 from document_freshness_auditor import hitl
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _status_waiters
     db.init_db()
-    hitl.install()
+    # Created here: an anyio limiter needs the running event loop
+    _status_waiters = anyio.CapacityLimiter(MAX_STATUS_WAITERS)
     yield
     hitl.uninstall()
 
@@ -42,6 +45,19 @@ app.add_middleware(
 )
 
 
+# Upper bound, in seconds, for a long-polling GET /hitl/status request
+MAX_STATUS_WAIT = 30.0
+# Long-polls sleep in threads of their own, capped by this limiter instead of
+# holding workers of the shared threadpool that POST /hitl/feedback (the call
+# that ends their wait) and the other sync endpoints run on
+MAX_STATUS_WAITERS = 64
+_status_waiters = None
+
+# Agent output may wrap its JSON array in a ```json fence or in prose
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\[.*?\])\s*```", re.DOTALL | re.IGNORECASE)
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
 class AnalyzeRequest(BaseModel):
     project_name: str = Field(..., min_length=1, description="Human-readable project name")
     project_path: str = Field(..., min_length=1, description="Absolute path to the project directory")
@@ -133,12 +149,12 @@ def _try_extract_json_array(text: str) -> str:
     candidates: list[str] = [text]
 
     # Try fenced code block
-    fenced = re.search(r"```(?:json)?\s*(\[.*?\])\s*```", text, re.DOTALL | re.IGNORECASE)
+    fenced = _FENCED_JSON_RE.search(text)
     if fenced:
         candidates.insert(0, fenced.group(1).strip())
 
     # Try bracket extraction (outermost [...])
-    bracket = re.search(r"\[.*\]", text, re.DOTALL)
+    bracket = _JSON_ARRAY_RE.search(text)
     if bracket:
         candidates.append(bracket.group(0).strip())
 
@@ -206,6 +222,12 @@ def grab_outputs(result):
 
 def run_crew_background(report_id, project_path):
     try:
+        # Imported, and the HITL patch installed, on the first audit so the
+        # server starts without loading crewai
+        from document_freshness_auditor.crew import DocumentFreshnessAuditor
+        if not hitl.is_patched:
+            hitl.install()
+
         hitl.link_report(report_id)
         auditor = DocumentFreshnessAuditor()
 
@@ -261,16 +283,25 @@ def start_audit(req: AnalyzeRequest):
         "report_id": report["id"],
         "project_id": project["id"],
         "status": "processing",
-        "message": "Audit started. Poll GET /hitl/status/{report_id} for progress.",
+        "message": "Audit started. Poll GET /hitl/status/{report_id}?wait=30 for progress.",
     }
 
 
 @app.get("/hitl/status/{report_id}")
-def check_status(report_id: str):
-    report = db.get_report(report_id)
+async def check_status(report_id: str, wait: float = 0):
+    """Report status; with wait > 0, long-poll while the crew is processing."""
+    report = await run_in_threadpool(db.get_report_summary, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
+    if wait > 0 and report["status"] == "processing":
+        updated = await anyio.to_thread.run_sync(
+            hitl.wait_for_update, report_id, min(wait, MAX_STATUS_WAIT),
+            limiter=_status_waiters,
+        )
+        if updated:
+            report = await run_in_threadpool(db.get_report_summary, report_id) or report
+
     resp: dict[str, Any] = {
         "report_id": report_id,
         "status": report["status"],
@@ -295,7 +326,7 @@ def check_status(report_id: str):
 
 @app.post("/hitl/feedback")
 def give_feedback(req: HITLFeedbackRequest):
-    report = db.get_report(req.report_id)
+    report = db.get_report_summary(req.report_id)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
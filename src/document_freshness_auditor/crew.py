@@ -12,7 +12,8 @@ from document_freshness_auditor.tools.doc_tools import (
     SrsParserTool,
     GitAnalyzerTool,
     DiffGeneratorTool,
-    ReadFileTool
+    ReadFileTool,
+    BatchAuditTool
 )
 from document_freshness_auditor.tools.freshness_scorer import freshness_scorer
 
@@ -45,7 +46,8 @@ class DocumentFreshnessAuditor():
                 CodeCommentTool(),
                 ListFilesTool(),
                 SrsParserTool(),
-                GitAnalyzerTool()
+                GitAnalyzerTool(),
+                BatchAuditTool()
             ],
             verbose=True,
             max_iter=50,
@@ -3,54 +3,117 @@ import uuid
 import json
 import re
 import os
+import threading
 from datetime import datetime, timezone
 
+try:
+    import msgspec
+except ImportError:  # optional: C-backed JSON decoding for parse_analysis
+    msgspec = None
+
 
 DB_FILE = os.getenv("FRESHNESS_DB_PATH", "freshness_auditor.db")
 
+# Outermost [...] span in agent output wrapped in prose
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Connection kept open per thread; close() hands it back instead.
+
+    Writers use it as ``with get_conn() as conn:`` so that an exception rolls
+    back at once rather than holding the write lock until the next call.
+    """
+
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+
+
+_local = threading.local()
+
 
 def get_conn():
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    # Reusing the thread's connection skips the open and PRAGMA round-trips
+    # and keeps sqlite3's per-connection prepared-statement cache warm.
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != DB_FILE:
+        conn = sqlite3.connect(DB_FILE, factory=_PooledConnection)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        _local.conn, _local.path = conn, DB_FILE
+    elif conn.in_transaction:
+        conn.rollback()
     return conn
 
 
 def init_db():
-    conn = get_conn()
+    with get_conn() as conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS projects (
+                id          TEXT PRIMARY KEY,
+                name        TEXT NOT NULL,
+                path        TEXT NOT NULL,
+                created_at  TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS reports (
+                id              TEXT PRIMARY KEY,
+                project_id      TEXT NOT NULL,
+                status          TEXT NOT NULL DEFAULT 'completed',
+                total_files     INTEGER NOT NULL DEFAULT 0,
+                critical_issues INTEGER NOT NULL DEFAULT 0,
+                major_issues    INTEGER NOT NULL DEFAULT 0,
+                minor_issues    INTEGER NOT NULL DEFAULT 0,
+                average_score   REAL NOT NULL DEFAULT 0.0,
+                severity        TEXT NOT NULL DEFAULT 'minor',
+                report_md       TEXT,
+                analysis_json   TEXT,
+                audit_raw       TEXT,
+                agent_output    TEXT DEFAULT '',
+                created_at      TEXT NOT NULL,
+                FOREIGN KEY (project_id) REFERENCES projects(id)
+            );
+        """)
+        try:
+            conn.execute("SELECT agent_output FROM reports LIMIT 1")
+        except sqlite3.OperationalError:
+            conn.execute("ALTER TABLE reports ADD COLUMN agent_output TEXT DEFAULT ''")
+        try:
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_name_path ON projects(name, path)"
+            )
+        except sqlite3.IntegrityError:
+            _dedupe_projects(conn)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_name_path ON projects(name, path)"
+            )
+
+
+def _dedupe_projects(conn):
+    """Collapse duplicate (name, path) projects onto the oldest row.
+
+    Databases created before the unique index existed may hold several rows
+    for the same project; their reports are re-pointed at the surviving row.
+    """
     conn.executescript("""
-        CREATE TABLE IF NOT EXISTS projects (
-            id          TEXT PRIMARY KEY,
-            name        TEXT NOT NULL,
-            path        TEXT NOT NULL,
-            created_at  TEXT NOT NULL
+        UPDATE reports SET project_id = (
+            SELECT keep.id FROM projects dup
+            JOIN projects keep ON keep.rowid = (
+                SELECT MIN(rowid) FROM projects
+                WHERE name = dup.name AND path = dup.path
+            )
+            WHERE dup.id = reports.project_id
+        )
+        WHERE project_id IN (
+            SELECT id FROM projects
+            WHERE rowid NOT IN (SELECT MIN(rowid) FROM projects GROUP BY name, path)
         );
 
-        CREATE TABLE IF NOT EXISTS reports (
-            id              TEXT PRIMARY KEY,
-            project_id      TEXT NOT NULL,
-            status          TEXT NOT NULL DEFAULT 'completed',
-            total_files     INTEGER NOT NULL DEFAULT 0,
-            critical_issues INTEGER NOT NULL DEFAULT 0,
-            major_issues    INTEGER NOT NULL DEFAULT 0,
-            minor_issues    INTEGER NOT NULL DEFAULT 0,
-            average_score   REAL NOT NULL DEFAULT 0.0,
-            severity        TEXT NOT NULL DEFAULT 'minor',
-            report_md       TEXT,
-            analysis_json   TEXT,
-            audit_raw       TEXT,
-            agent_output    TEXT DEFAULT '',
-            created_at      TEXT NOT NULL,
-            FOREIGN KEY (project_id) REFERENCES projects(id)
-        );
+        DELETE FROM projects
+        WHERE rowid NOT IN (SELECT MIN(rowid) FROM projects GROUP BY name, path);
     """)
-    try:
-        conn.execute("SELECT agent_output FROM reports LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE reports ADD COLUMN agent_output TEXT DEFAULT ''")
-    conn.commit()
-    conn.close()
 
 
 def _extract_issue_text(iss):
@@ -96,6 +159,32 @@ def _get_file_path(item):
     return ""
 
 
+def _issue_row(number, iss, location):
+    """Build the normalised issue dict stored under a file entry."""
+    if isinstance(iss, str):
+        iss = {"description": iss}
+    return {
+        "number": number,
+        "issue": _extract_issue_text(iss),
+        "location": location,
+        "impact": _extract_field(iss, "impact", "why_it_matters", "reason"),
+        "expected": _extract_field(iss, "expected", "what_docs_say", "documented"),
+        "actual": _extract_field(iss, "actual", "what_code_does", "reality"),
+        "fix_priority": _extract_field(iss, "fix_priority", "priority"),
+        "severity": _extract_field(iss, "severity"),
+    }
+
+
+def _row_location(row):
+    """Location of an audit-finding row, falling back to its integer line."""
+    location = str(row.get("location", "") or "")
+    if not location:
+        line = row.get("line")
+        if isinstance(line, int):
+            location = f"Line {line}"
+    return location
+
+
 def _build_recommendations(issues):
     """Build concise, actionable recommendation strings from issue dicts."""
     recs = []
@@ -127,6 +216,16 @@ def _build_recommendations(issues):
     return recs
 
 
+def _loads(text):
+    """Decode JSON, preferring msgspec's C decoder when it is installed."""
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(text)
+        except msgspec.DecodeError:
+            pass
+    return json.loads(text)
+
+
 def parse_analysis(raw_str):
     empty = {
         "total_files": 0,
@@ -145,12 +244,12 @@ def parse_analysis(raw_str):
 
     data = None
     try:
-        data = json.loads(text)
+        data = _loads(text)
     except json.JSONDecodeError:
-        match = re.search(r"\[.*\]", text, re.DOTALL)
+        match = _JSON_ARRAY_RE.search(text)
         if match:
             try:
-                data = json.loads(match.group())
+                data = _loads(match.group())
             except json.JSONDecodeError:
                 pass
 
@@ -186,22 +285,11 @@ def parse_analysis(raw_str):
             if not isinstance(issues, list):
                 issues = []
 
-            numbered = []
-            for i, iss in enumerate(issues, 1):
-                if isinstance(iss, str):
-                    iss = {"description": iss}
-                if not isinstance(iss, dict):
-                    continue
-                numbered.append({
-                    "number": i,
-                    "issue": _extract_issue_text(iss),
-                    "location": _extract_field(iss, "location", "line"),
-                    "impact": _extract_field(iss, "impact", "why_it_matters", "reason"),
-                    "expected": _extract_field(iss, "expected", "what_docs_say", "documented"),
-                    "actual": _extract_field(iss, "actual", "what_code_does", "reality"),
-                    "fix_priority": _extract_field(iss, "fix_priority", "priority"),
-                    "severity": _extract_field(iss, "severity"),
-                })
+            numbered = [
+                _issue_row(i, iss, _extract_field(iss, "location", "line"))
+                for i, iss in enumerate(issues, 1)
+                if isinstance(iss, (str, dict))
+            ]
 
             recs = item.get("recommendations", []) or []
             if isinstance(recs, str):
@@ -272,7 +360,6 @@ def parse_analysis(raw_str):
         for file_path, rows in grouped.items():
             by_sev = {"critical": 0, "major": 0, "minor": 0}
             doc_type = ""
-            issue_rows = []
 
             for r in rows:
                 sev = str(r.get("severity", "minor")).lower()
@@ -283,22 +370,10 @@ def parse_analysis(raw_str):
                 if not doc_type:
                     doc_type = _extract_field(r, "doc_type", "type", "category", "kind")
 
-                location = str(r.get("location", "") or "")
-                if not location:
-                    line = r.get("line")
-                    if isinstance(line, int):
-                        location = f"Line {line}"
-
-                issue_rows.append({
-                    "number": 0,
-                    "issue": _extract_issue_text(r),
-                    "location": location,
-                    "impact": _extract_field(r, "impact", "why_it_matters", "reason"),
-                    "expected": _extract_field(r, "expected", "what_docs_say", "documented"),
-                    "actual": _extract_field(r, "actual", "what_code_does", "reality"),
-                    "fix_priority": _extract_field(r, "fix_priority", "priority"),
-                    "severity": _extract_field(r, "severity"),
-                })
+            issue_rows = [
+                _issue_row(i, r, _row_location(r))
+                for i, r in enumerate(rows, 1)
+            ]
 
             if by_sev["critical"] > 0:
                 file_sev = "critical"
@@ -313,9 +388,6 @@ def parse_analysis(raw_str):
                 + by_sev["minor"] * 4.0
             ))
 
-            for i, it in enumerate(issue_rows, 1):
-                it["number"] = i
-
             # Auto-generate recommendations from issues
             recs = _build_recommendations(issue_rows)
 
@@ -371,24 +443,16 @@ def parse_analysis(raw_str):
 
 
 def create_project(name, path):
-    conn = get_conn()
-    row = conn.execute(
-        "SELECT * FROM projects WHERE name = ? AND path = ?",
-        (name, path),
-    ).fetchone()
-    if row:
-        conn.close()
-        return dict(row)
-
-    pid = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
-    conn.execute(
-        "INSERT INTO projects (id, name, path, created_at) VALUES (?, ?, ?, ?)",
-        (pid, name, path, now),
-    )
-    conn.commit()
-    conn.close()
-    return {"id": pid, "name": name, "path": path, "created_at": now}
+    # Upsert: the no-op DO UPDATE makes RETURNING yield the existing row on
+    # conflict, so lookup and insert happen in one atomic statement.
+    with get_conn() as conn:
+        row = conn.execute(
+            """INSERT INTO projects (id, name, path, created_at) VALUES (?, ?, ?, ?)
+               ON CONFLICT(name, path) DO UPDATE SET name = excluded.name
+               RETURNING *""",
+            (str(uuid.uuid4()), name, path, datetime.now(timezone.utc).isoformat()),
+        ).fetchone()
+    return dict(row)
 
 
 def get_project(project_id):
@@ -421,22 +485,20 @@ def create_report(project_id, report_md="", analysis_json="", audit_raw=""):
 
     stats = parse_analysis(analysis_json)
 
-    conn = get_conn()
-    conn.execute(
-        """INSERT INTO reports
-           (id, project_id, status, total_files, critical_issues, major_issues,
-            minor_issues, average_score, severity, report_md, analysis_json,
-            audit_raw, created_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            rid, project_id, "completed",
-            stats["total_files"], stats["critical_issues"], stats["major_issues"],
-            stats["minor_issues"], stats["average_score"], stats["severity"],
-            report_md, analysis_json, audit_raw, now,
-        ),
-    )
-    conn.commit()
-    conn.close()
+    with get_conn() as conn:
+        conn.execute(
+            """INSERT INTO reports
+               (id, project_id, status, total_files, critical_issues, major_issues,
+                minor_issues, average_score, severity, report_md, analysis_json,
+                audit_raw, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                rid, project_id, "completed",
+                stats["total_files"], stats["critical_issues"], stats["major_issues"],
+                stats["minor_issues"], stats["average_score"], stats["severity"],
+                report_md, analysis_json, audit_raw, now,
+            ),
+        )
 
     return {
         "id": rid,
@@ -457,22 +519,20 @@ def create_pending_report(project_id, analysis_json="", audit_raw=""):
     now = datetime.now(timezone.utc).isoformat()
     stats = parse_analysis(analysis_json)
 
-    conn = get_conn()
-    conn.execute(
-        """INSERT INTO reports
-           (id, project_id, status, total_files, critical_issues, major_issues,
-            minor_issues, average_score, severity, report_md, analysis_json,
-            audit_raw, created_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            rid, project_id, "awaiting_user_input",
-            stats["total_files"], stats["critical_issues"], stats["major_issues"],
-            stats["minor_issues"], stats["average_score"], stats["severity"],
-            "", analysis_json, audit_raw, now,
-        ),
-    )
-    conn.commit()
-    conn.close()
+    with get_conn() as conn:
+        conn.execute(
+            """INSERT INTO reports
+               (id, project_id, status, total_files, critical_issues, major_issues,
+                minor_issues, average_score, severity, report_md, analysis_json,
+                audit_raw, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                rid, project_id, "awaiting_user_input",
+                stats["total_files"], stats["critical_issues"], stats["major_issues"],
+                stats["minor_issues"], stats["average_score"], stats["severity"],
+                "", analysis_json, audit_raw, now,
+            ),
+        )
 
     return {
         "id": rid,
@@ -489,30 +549,29 @@ def create_pending_report(project_id, analysis_json="", audit_raw=""):
 
 
 def finalize_report(report_id, report_md, analysis_json="", audit_raw=""):
-    conn = get_conn()
-    if analysis_json:
-        stats = parse_analysis(analysis_json)
-        conn.execute(
-            """UPDATE reports
-               SET report_md = ?, status = 'completed',
-                   analysis_json = ?, audit_raw = ?,
-                   total_files = ?, critical_issues = ?, major_issues = ?,
-                   minor_issues = ?, average_score = ?, severity = ?
-               WHERE id = ?""",
-            (
-                report_md, analysis_json, audit_raw,
-                stats["total_files"], stats["critical_issues"],
-                stats["major_issues"], stats["minor_issues"],
-                stats["average_score"], stats["severity"],
-                report_id,
-            ),
-        )
-    else:
-        conn.execute(
-            "UPDATE reports SET report_md = ?, status = 'completed' WHERE id = ?",
-            (report_md, report_id),
-        )
-    conn.commit()
+    with get_conn() as conn:
+        if analysis_json:
+            stats = parse_analysis(analysis_json)
+            conn.execute(
+                """UPDATE reports
+                   SET report_md = ?, status = 'completed',
+                       analysis_json = ?, audit_raw = ?,
+                       total_files = ?, critical_issues = ?, major_issues = ?,
+                       minor_issues = ?, average_score = ?, severity = ?
+                   WHERE id = ?""",
+                (
+                    report_md, analysis_json, audit_raw,
+                    stats["total_files"], stats["critical_issues"],
+                    stats["major_issues"], stats["minor_issues"],
+                    stats["average_score"], stats["severity"],
+                    report_id,
+                ),
+            )
+        else:
+            conn.execute(
+                "UPDATE reports SET report_md = ?, status = 'completed' WHERE id = ?",
+                (report_md, report_id),
+            )
     row = conn.execute(
         """SELECT id, project_id, status, total_files, critical_issues, major_issues,
                   minor_issues, average_score, severity, created_at
@@ -524,19 +583,17 @@ def finalize_report(report_id, report_md, analysis_json="", audit_raw=""):
 
 
 def set_status(report_id, status, agent_output=None):
-    conn = get_conn()
-    if agent_output is not None:
-        conn.execute(
-            "UPDATE reports SET status = ?, agent_output = ? WHERE id = ?",
-            (status, agent_output, report_id),
-        )
-    else:
-        conn.execute(
-            "UPDATE reports SET status = ? WHERE id = ?",
-            (status, report_id),
-        )
-    conn.commit()
-    conn.close()
+    with get_conn() as conn:
+        if agent_output is not None:
+            conn.execute(
+                "UPDATE reports SET status = ?, agent_output = ? WHERE id = ?",
+                (status, agent_output, report_id),
+            )
+        else:
+            conn.execute(
+                "UPDATE reports SET status = ? WHERE id = ?",
+                (status, report_id),
+            )
 
 
 update_report_status = set_status
@@ -545,17 +602,15 @@ update_report_status = set_status
 def create_hitl_report(project_id):
     rid = str(uuid.uuid4())
     now = datetime.now(timezone.utc).isoformat()
-    conn = get_conn()
-    conn.execute(
-        """INSERT INTO reports
-           (id, project_id, status, total_files, critical_issues, major_issues,
-            minor_issues, average_score, severity, report_md, analysis_json,
-            audit_raw, agent_output, created_at)
-           VALUES (?, ?, ?, 0, 0, 0, 0, 0.0, 'minor', '', '', '', '', ?)""",
-        (rid, project_id, "processing", now),
-    )
-    conn.commit()
-    conn.close()
+    with get_conn() as conn:
+        conn.execute(
+            """INSERT INTO reports
+               (id, project_id, status, total_files, critical_issues, major_issues,
+                minor_issues, average_score, severity, report_md, analysis_json,
+                audit_raw, agent_output, created_at)
+               VALUES (?, ?, ?, 0, 0, 0, 0, 0.0, 'minor', '', '', '', '', ?)""",
+            (rid, project_id, "processing", now),
+        )
     return {
         "id": rid,
         "project_id": project_id,
@@ -575,6 +630,20 @@ def get_report(report_id):
     return d
 
 
+def get_report_summary(report_id):
+    """Fetch a report's status and counts without the large JSON/raw columns."""
+    conn = get_conn()
+    row = conn.execute(
+        """SELECT id, project_id, status, total_files, critical_issues,
+                  major_issues, minor_issues, average_score, severity,
+                  agent_output, created_at
+           FROM reports WHERE id = ?""",
+        (report_id,),
+    ).fetchone()
+    conn.close()
+    return dict(row) if row else None
+
+
 def list_reports_for_project(project_id):
     conn = get_conn()
     rows = conn.execute(
@@ -605,7 +674,8 @@ def get_audit_history():
 def get_full_report(report_id):
     conn = get_conn()
     row = conn.execute(
-        """SELECT r.*, p.name AS project_name
+        """SELECT r.id, r.project_id, r.status, r.report_md, r.analysis_json,
+                  r.created_at, p.name AS project_name
            FROM reports r
            JOIN projects p ON r.project_id = p.id
            WHERE r.id = ?""",
@@ -1,45 +1,73 @@
 import threading
+from concurrent.futures import Future
 
+from document_freshness_auditor import db
+
+# report_id -> pending entry; dict get/set/pop are atomic under the GIL, so
+# popping an entry is what hands its future to exactly one feedback sender.
 waiting = {}
-lock = threading.Lock()
-thread_to_report = {}
+# the report the current crew thread is working on (attribute: report_id)
+current = threading.local()
+# reports whose crew is running in this process; with `waiting`, this tells
+# long-polling status readers when a report has left the "processing" state
+running = set()
+updated = threading.Condition()
 original_func = None
 is_patched = False
+# install() may race from several audit threads; patching twice would save
+# the patched method as the "original"
+_install_lock = threading.Lock()
 
 
 def link_report(report_id):
-    tid = threading.current_thread().ident
-    thread_to_report[tid] = report_id
-    print(f"[HITL] linked thread={tid} to report={report_id}")
+    current.report_id = report_id
+    running.add(report_id)
+    print(f"[HITL] linked thread={threading.get_ident()} to report={report_id}")
 
 
 def get_report_for_thread():
-    tid = threading.current_thread().ident
-    rid = thread_to_report.get(tid)
-    print(f"[HITL] thread={tid} is working on report={rid}")
+    rid = getattr(current, "report_id", None)
+    print(f"[HITL] thread={threading.get_ident()} is working on report={rid}")
     return rid
 
 
 def unlink_report():
-    tid = threading.current_thread().ident
-    thread_to_report.pop(tid, None)
+    current.report_id = None
 
 
 def send_feedback(report_id, feedback):
-    with lock:
-        entry = waiting.get(report_id)
-        if entry is None or entry["event"].is_set():
-            return False
-        entry["feedback"] = feedback
-        entry["event"].set()
+    entry = waiting.pop(report_id, None)
+    if entry is None:
+        return False
+    entry["future"].set_result(feedback)
     print(f"[HITL] feedback sent for {report_id}, length={len(feedback)}")
     return True
 
 
+def notify_update():
+    with updated:
+        updated.notify_all()
+
+
+def wait_for_update(report_id, timeout):
+    """Block until report_id's crew pauses for feedback or stops, or timeout.
+
+    Lets status readers long-poll instead of re-polling on a timer: the
+    waiter sleeps on a condition variable that is notified only when the
+    crew actually changes state. Returns False if the timeout expired.
+    """
+    with updated:
+        return updated.wait_for(
+            lambda: report_id in waiting or report_id not in running,
+            timeout,
+        )
+
+
 def remove(report_id):
-    with lock:
-        waiting.pop(report_id, None)
+    waiting.pop(report_id, None)
+    running.discard(report_id)
     unlink_report()
+    notify_update()
     print(f"[HITL] cleaned up report={report_id}")
 
 
@@ -57,27 +85,22 @@ def ask_human_via_api(self, final_answer):
     entry = {
         "report_id": report_id,
         "agent_output": final_answer,
-        "feedback": None,
-        "event": threading.Event()
+        "future": Future(),
     }
-    with lock:
-        waiting[report_id] = entry
+    waiting[report_id] = entry
 
     try:
-        from document_freshness_auditor import db
         db.set_status(report_id, "pending_human_input", agent_output=final_answer)
         print(f"[HITL] db updated to pending_human_input for {report_id}")
     except Exception as e:
         print(f"[HITL] ERROR updating db: {e}")
+    notify_update()
 
     print(f"[HITL] waiting for feedback on {report_id}...")
-    entry["event"].wait()
-
-    feedback = entry["feedback"] or ""
+    feedback = entry["future"].result() or ""
     print(f"[HITL] got feedback for {report_id}: {feedback[:100]!r}")
 
     try:
-        from document_freshness_auditor import db
         db.set_status(report_id, "processing")
     except Exception as e:
         print(f"[HITL] ERROR setting status back: {e}")
@@ -87,15 +110,16 @@ def ask_human_via_api(self, final_answer):
 
 def install():
     global original_func, is_patched
-    if is_patched:
-        print("[HITL] already patched, skipping")
-        return
+    with _install_lock:
+        if is_patched:
+            print("[HITL] already patched, skipping")
+            return
 
-    from crewai.agents.crew_agent_executor import CrewAgentExecutor
+        from crewai.agents.crew_agent_executor import CrewAgentExecutor
 
-    original_func = CrewAgentExecutor._ask_human_input
-    CrewAgentExecutor._ask_human_input = ask_human_via_api
-    is_patched = True
+        original_func = CrewAgentExecutor._ask_human_input
+        CrewAgentExecutor._ask_human_input = ask_human_via_api
+        is_patched = True
     print(f"[HITL] ✅ PATCH INSTALLED on CrewAgentExecutor._ask_human_input")
     print(f"[HITL]    original: {original_func}")
     print(f"[HITL]    patched:  {CrewAgentExecutor._ask_human_input}")
@@ -103,12 +127,13 @@ def install():
 
 def uninstall():
     global original_func, is_patched
-    if not is_patched or original_func is None:
-        return
+    with _install_lock:
+        if not is_patched or original_func is None:
+            return
 
-    from crewai.agents.crew_agent_executor import CrewAgentExecutor
+        from crewai.agents.crew_agent_executor import CrewAgentExecutor
 
-    CrewAgentExecutor._ask_human_input = original_func
-    original_func = None
-    is_patched = False
+        CrewAgentExecutor._ask_human_input = original_func
+        original_func = None
+        is_patched = False
     print("[HITL] Patch removed, original _ask_human_input restored")
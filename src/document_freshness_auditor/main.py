@@ -3,13 +3,15 @@ import sys
 import warnings
 import os
 from datetime import datetime
-from document_freshness_auditor.crew import DocumentFreshnessAuditor
 
 from dotenv import load_dotenv
 
 load_dotenv()
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# crewai is imported inside each command, so `serve` and other entry points
+# that do not build a crew here skip loading it at import time.
+
 def run():
     """
     Run the crew.
@@ -23,6 +25,8 @@ def run():
         'current_year': str(datetime.now().year)
     }
 
+    from document_freshness_auditor.crew import DocumentFreshnessAuditor
+
     try:
         DocumentFreshnessAuditor().crew().kickoff(inputs=inputs)
     except Exception as e:
@@ -34,12 +38,16 @@ def train():
         "project_path": os.getcwd(),
         'current_year': str(datetime.now().year)
     }
+    from document_freshness_auditor.crew import DocumentFreshnessAuditor
+
     try:
         DocumentFreshnessAuditor().crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs)
     except Exception as e:
         raise Exception(f"An error occurred while training the crew: {e}")
 
 def replay():
+    from document_freshness_auditor.crew import DocumentFreshnessAuditor
+
     try:
         DocumentFreshnessAuditor().crew().replay(task_id=sys.argv[1])
     except Exception as e:
@@ -50,6 +58,8 @@ def test():
         "project_path": os.getcwd(),
         "current_year": str(datetime.now().year)
     }
+    from document_freshness_auditor.crew import DocumentFreshnessAuditor
+
     try:
         DocumentFreshnessAuditor().crew().test(n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=inputs)
     except Exception as e:
@@ -1,15 +1,63 @@
 import os
 import ast
 import re
+import json
 import yaml
 import subprocess
 import difflib
 import locale
 import sys
+import functools
+import bisect
+import copy
+import threading
+import codecs
+import errno
+import mmap
+import stat
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate
 from datetime import datetime
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any, Tuple
 from crewai.tools import BaseTool
-from pathlib import Path
+
+try:
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:  # optional: C implementation of difflib's matcher
+    _SequenceMatcher = difflib.SequenceMatcher
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Line comments: Python (#) and C/JS (//), preceded by start-of-line or whitespace
+_LINE_COMMENT_RE = re.compile(r"(?:^|[^\S\n])(#|//)[^\n]*", re.MULTILINE)
+# Block comments: /* ... */, possibly spanning lines
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+# SRS scans run over the raw (memory-mapped) bytes of each markdown file
+_MD_HEADING_BYTES_RE = re.compile(rb"^[ \t\r\f\v]*(#[^\n]*)", re.MULTILINE)
+_REQ_ID_BYTES_RE = re.compile(rb"\b([A-Z]{2,}-\d+)\b")
+# Docstring parameter forms: ":param type name", ":param name", "name (type):"
+# Docstrings are scanned raw (tabs not expanded), so type lists accept tabs
+_DOC_TYPED_PARAM_RE = re.compile(r':param\s+[\w\[\], \t]+\s+(\w+)')
+_DOC_PARAM_RE = re.compile(r':param\s+(\w+)')
+# One multiline pass over the docstring; [^\S\n] keeps each match on one line
+_DOC_ARG_LINE_RE = re.compile(r'^[^\S\n]*(\w+)(?:[^\S\n]*\([\w\[\], \t]+\))?[^\S\n]*:', re.MULTILINE)
+# File and directory names mentioned in a README. The path run is capped:
+# unbounded, every "-" or "/" in a long run like "a-b-c-..." restarted a scan
+# to the end of the run, which is quadratic in the run length.
+_README_FILE_RE = re.compile(r'\b([\w/-]{1,255}\.(?:py|md|txt|yaml|json|toml))\b')
+_README_DIR_RE = re.compile(r'\b(src|tests|docs|lib|config)/?\b')
+# FastAPI/Flask route decorators; one scan catches both quote styles, the
+# path landing in group 1 (double quotes) or group 2 (single quotes)
+_ROUTE_RE = re.compile(
+    r"""@(?:app|router|api)\.(?:get|p(?:ost|ut|atch)|delete)\((?:"([^"]+)"|'([^']+)')\)"""
+)
 
 
 def _get_abs_path(file_path: str, project_root: str = "") -> str:
@@ -21,6 +69,20 @@ def _get_abs_path(file_path: str, project_root: str = "") -> str:
     return os.path.abspath(file_path)
 
 
+# Files above this size are decoded from an mmap instead of a read() copy
+_MMAP_READ_THRESHOLD = 1 << 16
+# How far into undecodable data _decode_bytes looks for a NUL byte
+_BINARY_SNIFF_BYTES = 8192
+# Source files above this size are almost always generated or minified; the
+# docstring and comment auditors skip them rather than parse them, and _load
+# does not keep them in its cache
+_MAX_AUDIT_BYTES = 2 << 20
+# Dependency, virtualenv and bytecode directories are never project content
+# and often dwarf it; directory walks do not descend into them. Hidden ones
+# (.git, .venv, .tox, ...) are already skipped as hidden names.
+_IGNORED_DIRS = frozenset({"node_modules", "__pycache__", "venv", "site-packages"})
+
+
 def _safe_read_text(path: str) -> str:
     """Read a file robustly: try UTF-8 (and BOM), then cp1252, then fallback.
 
@@ -28,17 +90,29 @@ def _safe_read_text(path: str) -> str:
     decoding bytes explicitly and using a replacement strategy as a last resort.
     """
     with open(path, "rb") as bf:
-        data = bf.read()
-
-    # build a prioritized list of encodings to try
-    encodings = ["utf-8", "utf-8-sig"]
-
-    # include the system preferred encoding if it isn't already present
+        if os.fstat(bf.fileno()).st_size <= _MMAP_READ_THRESHOLD:
+            return _decode_bytes(bf.read())
+        # Large files are decoded straight from the mapping, so the raw bytes
+        # are never copied into a Python object alongside the decoded str
+        with mmap.mmap(bf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _decode_bytes(mm)
+
+
+def _fallback_encodings() -> Tuple[str, ...]:
+    """Encodings _decode_bytes tries, in order, once its fast paths fail."""
+    # build a prioritized list of encodings to try; "utf-8-sig" is not among
+    # them: it only differs from "utf-8" by dropping a BOM, so it fails on
+    # exactly the same input and would just repeat the decode
+    encodings = ["utf-8"]
+
+    # include the system preferred encoding, by its canonical codec name so
+    # aliases like "UTF8" are recognized; a UTF-8 or ASCII locale adds
+    # nothing, as anything it decodes the "utf-8" attempt already has
     try:
-        pref = locale.getpreferredencoding(False) or ""
+        pref = codecs.lookup(locale.getpreferredencoding(False)).name
     except Exception:
         pref = ""
-    if pref and pref.lower() not in (e.lower() for e in encodings):
+    if pref and pref not in ("utf-8", "ascii"):
         encodings.append(pref)
 
     # on Windows, try the 'mbcs' codec which maps to the ANSI code page
@@ -53,14 +127,234 @@ def _safe_read_text(path: str) -> str:
     if "latin-1" not in encodings:
         encodings.append("latin-1")
 
-    for enc in encodings:
+    return tuple(encodings)
+
+
+# Resolved once at import: the locale lookup and list building are the same
+# for every decode that gets past the fast paths
+_FALLBACK_ENCODINGS = _fallback_encodings()
+
+
+def _decode_bytes(data: bytes, final: bool = True) -> str:
+    """Decode bytes with the same encoding fallbacks as _safe_read_text.
+
+    With final=False the data may be a truncated prefix: a multi-byte
+    character cut off at the end is dropped instead of failing the decode.
+    Any buffer works as data, including an mmap.
+    """
+    # fast paths for the common cases, without an incremental decoder: pure
+    # ASCII (which a truncated prefix cannot split), then UTF-8, which is
+    # tried first below anyway
+    if isinstance(data, bytes) and data.isascii():
+        return data.decode("ascii")
+    if final:
         try:
-            return data.decode(enc)
+            return str(data, "utf-8")
+        except UnicodeDecodeError:
+            pass
+
+    # UTF-16 announces itself with a BOM in the first two bytes; sniff it
+    # rather than letting cp1252/latin-1 below turn it into mojibake
+    if data[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+        try:
+            return codecs.getincrementaldecoder("utf-16")().decode(data, final)
+        except UnicodeDecodeError:
+            pass
+
+    # a NUL byte near the start means a binary file (text in UTF-16 was
+    # handled above): no legacy codec will make text of it, so skip straight
+    # to the replacing decode instead of running every fallback over it
+    if b"\0" in data[:_BINARY_SNIFF_BYTES]:
+        return str(data, "utf-8", errors="replace")
+
+    # with final set, the fast path above has already tried UTF-8
+    for enc in _FALLBACK_ENCODINGS[1:] if final else _FALLBACK_ENCODINGS:
+        try:
+            return codecs.getincrementaldecoder(enc)().decode(data, final)
         except Exception:
             continue
 
     # final fallback: decode as utf-8 with replacement to avoid exceptions
-    return data.decode("utf-8", errors="replace")
+    return str(data, "utf-8", errors="replace")
+
+def _iter_files(base_dir: str, include_dirs: bool = False):
+    """Yield (path, relative_path) for every non-hidden file under base_dir.
+
+    Directories named in _IGNORED_DIRS are skipped along with their contents.
+
+    Walks with os.scandir so is_dir() is answered from the directory read
+    rather than a stat per entry, and builds relative paths while descending
+    instead of calling os.path.relpath per file. Order matches a top-down
+    os.walk; symlinked directories are not followed. With include_dirs,
+    directories are yielded too, just before their own files.
+    """
+    stack = [(base_dir, "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                if entry.name in _IGNORED_DIRS:
+                    continue
+                if include_dirs:
+                    yield entry.path, rel_dir + entry.name
+                if not entry.is_symlink():
+                    subdirs.append((entry.path, rel_dir + entry.name + os.sep))
+            else:
+                yield entry.path, rel_dir + entry.name
+        stack.extend(reversed(subdirs))
+
+
+@contextmanager
+def _mapped(path: str):
+    """Map a file read-only so byte regexes can scan it without a full read."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+class _SourceBundle:
+    """Decoded text of one file, with its line offsets and AST built on demand.
+
+    Only offsets are kept, not a list of line strings: callers slice source
+    directly, and a cached bundle then costs little more than its text.
+    """
+
+    __slots__ = ("path", "source", "_line_starts", "_tree")
+
+    def __init__(self, path: str, source: str):
+        self.path = path
+        self.source = source
+        self._line_starts = None
+        self._tree = None
+
+    @property
+    def line_starts(self) -> List[int]:
+        """Offset of each line in source, plus a final len(source) sentinel."""
+        if self._line_starts is None:
+            # splitlines is only used for its line boundaries here (the same
+            # ones str.splitlines applies everywhere); the strings are dropped
+            self._line_starts = [
+                0, *accumulate(map(len, self.source.splitlines(keepends=True)))
+            ]
+        return self._line_starts
+
+    @property
+    def tree(self) -> ast.Module:
+        if self._tree is None:
+            self._tree = ast.parse(self.source, filename=self.path)
+        return self._tree
+
+
+@functools.lru_cache(maxsize=512)
+def _load_bundle(path: str, mtime_ns: int, size: int) -> _SourceBundle:
+    return _SourceBundle(path, _safe_read_text(path))
+
+
+def _safe_stat(path: str) -> Optional[os.stat_result]:
+    """Stat path once, returning None if it does not exist.
+
+    Replaces an os.path.exists check followed by a second stat of the file.
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _load(path: str, st: Optional[os.stat_result] = None) -> _SourceBundle:
+    """Return the cached source bundle for path, re-reading it when it changes.
+
+    The (mtime, size) pair is part of the cache key, so an edited file gets a
+    fresh entry and the stale one ages out of the LRU. Pass st when the
+    caller has already stat'ed the file. Files over _MAX_AUDIT_BYTES are read
+    but not cached, so one large log or data file is not pinned in memory.
+    """
+    if st is None:
+        st = os.stat(path)
+    if st.st_size > _MAX_AUDIT_BYTES:
+        return _SourceBundle(path, _safe_read_text(path))
+    return _load_bundle(path, st.st_mtime_ns, st.st_size)
+
+
+class _ResultCache:
+    """Bounded LRU of tool results keyed on a file's (mtime, size) and args.
+
+    Re-running a tool on an unchanged file returns a copy of the earlier
+    result; editing the file changes its key, and old keys age out.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, path: str, args: tuple, compute, st: Optional[os.stat_result] = None):
+        if st is None:
+            st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size, *args)
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return copy.deepcopy(self._data[key])
+        result = compute()
+        with self._lock:
+            self._data[key] = result
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return copy.deepcopy(result)
+
+
+_docstring_results = _ResultCache()
+_comment_results = _ResultCache()
+# ApiImplementationTool: endpoints of a spec file, routes of a code file
+_spec_endpoint_results = _ResultCache()
+_code_route_results = _ResultCache()
+
+
+class _FunctionCollector(ast.NodeVisitor):
+    """Collect every function and method, with the name of its class.
+
+    Nested functions are collected too; inside a function body the class
+    name is reset, so a helper defined in a method is not reported as one.
+    """
+
+    def __init__(self):
+        self.functions = []
+        self._class_name = None
+
+    def visit_FunctionDef(self, node):
+        self.functions.append((node, self._class_name))
+        outer, self._class_name = self._class_name, None
+        self.generic_visit(node)
+        self._class_name = outer
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        outer, self._class_name = self._class_name, node.name
+        self.generic_visit(node)
+        self._class_name = outer
+
+
+def _signature_params(node: ast.AST) -> List[str]:
+    """Named parameters of a function, without a leading self/cls."""
+    args = node.args
+    params = [arg.arg for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs)]
+    if params and params[0] in ("self", "cls"):
+        params = params[1:]
+    return params
+
 
 class DocstringSignatureTool(BaseTool):
     name: str = "Docstring Signature Auditor"
@@ -68,12 +362,22 @@ class DocstringSignatureTool(BaseTool):
 
     def _run(self, file_path: str, project_root: str = "") -> Dict[str, Any]:
         abs_path = _get_abs_path(file_path, project_root)
-        if not os.path.isfile(abs_path) or not abs_path.endswith(".py"):
+        st = _safe_stat(abs_path)
+        if st is None or not stat.S_ISREG(st.st_mode) or not abs_path.endswith(".py"):
             return {"status": "error", "message": f"Invalid or missing .py file: {abs_path}"}
+        if st.st_size > _MAX_AUDIT_BYTES:
+            return {"status": "error", "message": f"Skipped {abs_path}: over {_MAX_AUDIT_BYTES >> 20} MiB, likely generated or minified"}
 
+        return _docstring_results.get_or_compute(
+            abs_path, (file_path, project_root),
+            lambda: self._audit(abs_path, file_path, project_root, st),
+            st=st,
+        )
+
+    def _audit(self, abs_path: str, file_path: str, project_root: str,
+               st: Optional[os.stat_result] = None) -> Dict[str, Any]:
         try:
-            content = _safe_read_text(abs_path)
-            tree = ast.parse(content, filename=abs_path)
+            tree = _load(abs_path, st).tree
         except Exception as e:
             return {"status": "error", "message": f"Parse error: {str(e)}"}
 
@@ -88,9 +392,10 @@ class DocstringSignatureTool(BaseTool):
             "minor_issues": 0
         }
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                self._process_node(node, issues, metrics)
+        collector = _FunctionCollector()
+        collector.visit(tree)
+        for node, class_name in collector.functions:
+            self._process_node(node, issues, metrics, class_name)
 
         # Normalize path for display
         display_path = file_path
@@ -117,24 +422,16 @@ class DocstringSignatureTool(BaseTool):
             "issues": issues
         }
 
-    def _process_node(self, node: ast.AST, issues: List[Dict], metrics: Dict):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            metrics["total_functions"] += 1
-            if ast.get_docstring(node):
-                metrics["functions_with_docstrings"] += 1
-            
-            issue = self._check_function(node)
-            self._update_metrics_from_issue(issue, node, issues, metrics)
-
-        elif isinstance(node, ast.ClassDef):
-            for item in node.body:
-                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    metrics["total_functions"] += 1
-                    if ast.get_docstring(item):
-                        metrics["functions_with_docstrings"] += 1
-                    
-                    issue = self._check_function(item, class_name=node.name)
-                    self._update_metrics_from_issue(issue, item, issues, metrics)
+    def _process_node(self, node: ast.AST, issues: List[Dict], metrics: Dict, class_name: str = None):
+        metrics["total_functions"] += 1
+        # Raw docstring: the scans below tolerate indentation and tabs, so the
+        # inspect.cleandoc pass get_docstring runs by default buys nothing
+        doc = ast.get_docstring(node, clean=False) or ""
+        if doc.strip():
+            metrics["functions_with_docstrings"] += 1
+
+        issue = self._check_function(node, class_name=class_name, doc=doc)
+        self._update_metrics_from_issue(issue, node, issues, metrics)
 
     def _update_metrics_from_issue(self, issue: Optional[Dict], node: ast.AST, issues: List[Dict], metrics: Dict):
         if issue:
@@ -151,41 +448,32 @@ class DocstringSignatureTool(BaseTool):
             metrics["documented_params"] += issue.get("_documented_params", 0)
         else:
             # If no issue, it means all params were documented
-            p_list = [arg.arg for arg in node.args.args]
-            if p_list and p_list[0] in ("self", "cls"):
-                p_list = p_list[1:]
-            metrics["total_params"] += len(p_list)
-            metrics["documented_params"] += len(p_list)
+            p_count = len(_signature_params(node))
+            metrics["total_params"] += p_count
+            metrics["documented_params"] += p_count
 
-    def _check_function(self, node: ast.FunctionDef, class_name: str = None) -> Dict or None:
+    def _check_function(self, node: ast.FunctionDef, class_name: str = None, doc: Optional[str] = None) -> Dict or None:
         name = f"{class_name}.{node.name}" if class_name else node.name
         line = node.lineno
 
-        # Get signature params (skip self/cls)
-        params = [arg.arg for arg in node.args.args]
-        if params and params[0] in ("self", "cls"):
-            params = params[1:]
+        params = _signature_params(node)
 
-        doc = ast.get_docstring(node) or ""
+        if doc is None:
+            doc = ast.get_docstring(node, clean=False) or ""
         if not doc.strip():
             return {"function": name, "line": line, "message": "Missing docstring"}
 
         # Basic param extraction from docstring
-        documented = set()
+        # Handle "name: description" or "name (type): description" lines
+        documented = set(_DOC_ARG_LINE_RE.findall(doc)) if ":" in doc else set()
         # Handle :param name: or :param type name: or :param name (type):
-        for match in re.findall(r':param\s+[\w\[\], ]+\s+(\w+)', doc):
-            documented.add(match)
-        for match in re.findall(r':param\s+(\w+)', doc):
-            documented.add(match)
-            
-        for line in doc.splitlines():
-            # Handle "name: description" or "name (type): description"
-            m = re.match(r'^\s*(\w+)(\s*\([\w\[\], ]+\))?\s*:', line.strip())
-            if m:
-                documented.add(m.group(1))
+        if ":param" in doc:
+            documented.update(_DOC_TYPED_PARAM_RE.findall(doc))
+            documented.update(_DOC_PARAM_RE.findall(doc))
 
         missing = [p for p in params if p not in documented]
-        stale = [p for p in documented if p not in params]
+        param_set = set(params)
+        stale = [p for p in documented if p not in param_set]
 
         # Internal metrics for recursion / summary
         res = {
@@ -220,7 +508,7 @@ class ReadmeStructureTool(BaseTool):
             return {"status": "error", "message": f"Invalid project root: {project_root}"}
 
         try:
-            content = _safe_read_text(abs_readme)
+            content = _load(abs_readme).source
         except Exception as e:
             return {"status": "error", "message": f"Read error: {str(e)}"}
 
@@ -256,39 +544,55 @@ class ReadmeStructureTool(BaseTool):
         }
 
     def _find_issues(self, content: str, root: str) -> List[Dict]:
-        issues = []
-
         # Simple file/dir mention extraction
-        # regex findall returns tuples if there are multiple groups
-        raw_mentions = re.findall(r'\b([\w/-]+\.(py|md|txt|yaml|json|toml))\b', content)
-        mentions = {m[0] if isinstance(m, tuple) else m for m in raw_mentions}
-        
-        # Add basic directories
-        dirs = re.findall(r'\b(src|tests|docs|lib|config)/?\b', content)
-        mentions.update(dirs)
-
-        # Get real relative paths
-        real_paths = set()
-        root_path = Path(root)
-        for path in root_path.rglob("*"):
-            if path.is_file() or path.is_dir():
-                try:
-                    rel = str(path.relative_to(root_path))
-                    real_paths.add(rel)
-                except ValueError:
-                    continue
+        mentions = set(_README_FILE_RE.findall(content))
 
-        # Check mentioned but missing
-        for mention in mentions:
-            # Normalize mention (strip trailing slash)
-            m = mention.rstrip('/')
-            if m not in real_paths:
-                issues.append({
-                    "type": "missing_mention",
-                    "message": f"Mentioned '{m}' does not exist in project"
-                })
+        # Add basic directories
+        mentions.update(_README_DIR_RE.findall(content))
+
+        # Check mentioned but missing (mentions normalized without trailing
+        # slash). Only the directories along each mention are listed, once
+        # each, rather than walking the whole project.
+        listings: Dict[str, Dict[str, os.DirEntry]] = {}
+        return [
+            {
+                "type": "missing_mention",
+                "message": f"Mentioned '{m}' does not exist in project"
+            }
+            for m in (mention.rstrip('/') for mention in mentions)
+            if not self._path_exists(root, m, listings)
+        ]
 
-        return issues
+    @staticmethod
+    def _path_exists(root: str, rel_path: str, listings: Dict[str, Dict[str, os.DirEntry]]) -> bool:
+        """Whether "/"-separated rel_path exists under root.
+
+        Names must match exactly (also on case-insensitive filesystems), hidden
+        names never match, and symlinked directories are not looked into, as in
+        _iter_files. Unlike there, _IGNORED_DIRS do count: a README pointing
+        into node_modules names something that does exist.
+        """
+        dir_path = root
+        parts = rel_path.split("/")
+        for i, name in enumerate(parts):
+            if not name or name.startswith("."):
+                return False
+            entries = listings.get(dir_path)
+            if entries is None:
+                try:
+                    with os.scandir(dir_path) as it:
+                        entries = {entry.name: entry for entry in it}
+                except OSError:
+                    entries = {}
+                listings[dir_path] = entries
+            entry = entries.get(name)
+            if entry is None:
+                return False
+            if i < len(parts) - 1:
+                if not entry.is_dir() or entry.is_symlink():
+                    return False
+                dir_path = entry.path
+        return True
 
 class ApiImplementationTool(BaseTool):
     name: str = "API Implementation Auditor"
@@ -298,7 +602,8 @@ class ApiImplementationTool(BaseTool):
         abs_spec = _get_abs_path(spec_path, project_root)
         abs_impl = _get_abs_path(impl_path, project_root)
 
-        if not os.path.isfile(abs_spec):
+        spec_st = _safe_stat(abs_spec)
+        if spec_st is None or not stat.S_ISREG(spec_st.st_mode):
             return {"status": "error", "message": f"OpenAPI spec not found: {abs_spec}"}
         
         if os.path.isdir(abs_impl):
@@ -319,58 +624,45 @@ class ApiImplementationTool(BaseTool):
                 else:
                     return {"status": "error", "message": f"Implementation directory found but no clear entry point (api.py, app.py, etc.) in {abs_impl}"}
 
-        if not os.path.isfile(abs_impl):
+        impl_st = _safe_stat(abs_impl)
+        if impl_st is None or not stat.S_ISREG(impl_st.st_mode):
             return {"status": "error", "message": f"Implementation file not found: {abs_impl}"}
 
-        # Read spec
+        # Spec endpoints and code routes are cached per file, so re-auditing
+        # an unchanged spec or module skips the parse and the regex scan
         try:
-            with open(abs_spec, "r", encoding="utf-8") as f:
-                if abs_spec.endswith(".yaml") or abs_spec.endswith(".yml"):
-                    spec = yaml.safe_load(f)
-                else:
-                    spec = json.load(f)
+            spec_endpoints = _spec_endpoint_results.get_or_compute(
+                abs_spec, (), lambda: self._spec_endpoints(abs_spec, spec_st), st=spec_st
+            )
         except Exception as e:
             return {"status": "error", "message": f"Failed to parse spec: {str(e)}"}
 
-        # Read implementation code
         try:
-            with open(abs_impl, "r", encoding="utf-8") as f:
-                code = f.read()
+            code_routes = _code_route_results.get_or_compute(
+                abs_impl, (), lambda: self._code_routes(abs_impl, impl_st), st=impl_st
+            )
         except Exception as e:
             return {"status": "error", "message": f"Failed to read code: {str(e)}"}
 
-        # Extract endpoints from spec
-        spec_endpoints = set(spec.get("paths", {}).keys())
-
-        # Extract routes from code (FastAPI/Flask)
-        patterns = [
-            r'@(?:app|router|api)\.(get|post|put|delete|patch)\("([^"]+)"\)',
-            r"@(?:app|router|api)\.(get|post|put|delete|patch)\(\'([^']+)\'\)"
-        ]
-        code_routes = set()
-        for pat in patterns:
-            matches = re.findall(pat, code)
-            for method, path in matches:
-                code_routes.add(path)
-
-        # Normalize endpoints
-        issues = []
-
         # In spec but missing in code
-        for path in spec_endpoints - code_routes:
-            issues.append({
+        issues = [
+            {
                 "type": "missing_implementation",
                 "severity": "critical",
                 "message": f"Endpoint {path} in spec but not in code"
-            })
+            }
+            for path in spec_endpoints - code_routes
+        ]
 
         # In code but missing in spec
-        for path in code_routes - spec_endpoints:
-            issues.append({
+        issues += [
+            {
                 "type": "undocumented_endpoint",
                 "severity": "major",
                 "message": f"Endpoint {path} in code but not in spec"
-            })
+            }
+            for path in code_routes - spec_endpoints
+        ]
 
         critical_count = sum(1 for i in issues if i["severity"] == "critical")
         major_count = sum(1 for i in issues if i["severity"] == "major")
@@ -389,23 +681,62 @@ class ApiImplementationTool(BaseTool):
             "issues": issues
         }
 
+    @staticmethod
+    def _spec_endpoints(abs_spec: str, st: os.stat_result) -> Set[str]:
+        spec_text = _load(abs_spec, st).source
+        if abs_spec.endswith(".yaml") or abs_spec.endswith(".yml"):
+            spec = yaml.load(spec_text, Loader=_YamlLoader)
+        else:
+            spec = json.loads(spec_text)
+        return set(spec.get("paths", {}).keys())
+
+    @staticmethod
+    def _code_routes(abs_impl: str, st: os.stat_result) -> Set[str]:
+        # Routes from FastAPI/Flask decorators, in either quote style
+        code = _load(abs_impl, st).source
+        return {double or single for double, single in _ROUTE_RE.findall(code)}
+
+
+
+def _to_json(result: Any) -> str:
+    # C-accelerated encoder; also gives the agent valid JSON instead of a repr
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
 
 
 class CodeCommentTool(BaseTool):
     name: str = "Code Comment Auditor"
     description: str = "Extracts inline comments and surrounding code for LLM-based verification of correctness."
 
-    def _run(self, file_path: str, project_root: str = "") -> Dict[str, Any]:
+    def _run(self, file_path: str, project_root: str = "") -> str:
+        return _to_json(self._collect(file_path, project_root))
+
+    def _collect(self, file_path: str, project_root: str = "") -> Dict[str, Any]:
         abs_path = _get_abs_path(file_path, project_root)
-        if not os.path.exists(abs_path):
+        st = _safe_stat(abs_path)
+        if st is None:
             return {"status": "error", "message": f"File {abs_path} not found."}
+        if st.st_size > _MAX_AUDIT_BYTES:
+            return {"status": "error", "message": f"Skipped {abs_path}: over {_MAX_AUDIT_BYTES >> 20} MiB, likely generated or minified"}
+
+        return _comment_results.get_or_compute(
+            abs_path, (file_path,),
+            lambda: self._audit(abs_path, file_path, st),
+            st=st,
+        )
 
-        content = _safe_read_text(abs_path)
-        lines = content.splitlines(keepends=True)
+    def _audit(self, abs_path: str, file_path: str,
+               st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        bundle = _load(abs_path, st)
+        source, starts = bundle.source, bundle.line_starts
 
+        # Each regex pass runs only if its marker occurs at all; a substring
+        # check is far cheaper than a finditer that finds nothing (Python
+        # files have no "/*", and many JS/CSS files no "#").
         comments_with_context = []
-        self._find_python_comment_context(lines, comments_with_context)
-        self._find_block_comment_context(lines, comments_with_context)
+        if "#" in source or "//" in source:
+            self._find_python_comment_context(source, starts, comments_with_context)
+        if "/*" in source:
+            self._find_block_comment_context(source, starts, comments_with_context)
 
         return {
             "status": "ok" if comments_with_context else "no_comments",
@@ -420,47 +751,29 @@ class CodeCommentTool(BaseTool):
             "issues": comments_with_context
         }
 
-    def _find_python_comment_context(self, lines: List[str], results: List[Dict]):
-        # Line comments: Python (#) and C/JS (//)
-        for i, line in enumerate(lines):
-            if re.search(r"(^|\s)#", line) or re.search(r"(^|\s)//", line):
-                context = lines[max(0, i-2):min(len(lines), i+3)]
-                results.append({
-                    "line_number": i + 1,
-                    "comment": line.strip(),
-                    "context": "".join(context)
-                })
-
-    def _find_block_comment_context(self, lines: List[str], results: List[Dict]):
-        # Block comments: /* ... */
-        in_block = False
-        block_start = 0
-        block_lines = []
-        for i, line in enumerate(lines):
-            if not in_block and "/*" in line:
-                in_block = True
-                block_start = i
-                block_lines = [line]
-                if "*/" in line:
-                    in_block = False
-                    context = lines[max(0, block_start-2):min(len(lines), i+3)]
-                    results.append({
-                        "line_range": f"{block_start + 1}-{i + 1}",
-                        "comment": "".join(block_lines).strip(),
-                        "context": "".join(context)
-                    })
-                continue
+    @staticmethod
+    def _context(source: str, starts: List[int], first: int, last: int) -> str:
+        # Two lines either side of lines first..last, sliced straight from source
+        return source[starts[max(0, first - 2)]:starts[min(len(starts) - 1, last + 3)]]
 
-            if in_block:
-                block_lines.append(line)
-                if "*/" in line:
-                    in_block = False
-                    context = lines[max(0, block_start-2):min(len(lines), i+3)]
-                    results.append({
-                        "line_range": f"{block_start + 1}-{i + 1}",
-                        "comment": "".join(block_lines).strip(),
-                        "context": "".join(context)
-                    })
+    def _find_python_comment_context(self, source: str, starts: List[int], results: List[Dict]):
+        for m in _LINE_COMMENT_RE.finditer(source):
+            i = bisect.bisect_right(starts, m.start(1)) - 1
+            results.append({
+                "line_number": i + 1,
+                "comment": source[starts[i]:starts[i + 1]].strip(),
+                "context": self._context(source, starts, i, i)
+            })
+
+    def _find_block_comment_context(self, source: str, starts: List[int], results: List[Dict]):
+        for m in _BLOCK_COMMENT_RE.finditer(source):
+            first = bisect.bisect_right(starts, m.start()) - 1
+            last = bisect.bisect_right(starts, m.end() - 1) - 1
+            results.append({
+                "line_range": f"{first + 1}-{last + 1}",
+                "comment": source[starts[first]:starts[last + 1]].strip(),
+                "context": self._context(source, starts, first, last)
+            })
 
 
 
@@ -472,20 +785,50 @@ class ListFilesTool(BaseTool):
         if not os.path.exists(directory):
             return f"Error: Directory {directory} not found."
         
-        file_list = []
-        self._collect_files(directory, file_list)
-        
-        return "\n".join(file_list) if file_list else "No files found in the directory."
+        # Stream relative paths straight into the join; hidden files and
+        # directories like .git are skipped by the walk
+        listing = "\n".join(rel_path for _, rel_path in _iter_files(directory))
+
+        return listing or "No files found in the directory."
 
-    def _collect_files(self, base_dir: str, file_list: List[str]):
-        for root, dirs, files in os.walk(base_dir):
-            # Skip hidden directories like .git
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            for file in files:
-                if not file.startswith('.'):
-                    f_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(f_path, base_dir)
-                    file_list.append(rel_path)
+
+def _format_range(start: int, stop: int) -> str:
+    # Same hunk-range notation as difflib's unified diff
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _unified_diff(a: List[str], b: List[str], fromfile: str, tofile: str, n: int = 3):
+    """difflib.unified_diff(..., lineterm="") driven by _SequenceMatcher.
+
+    The stdlib function hard-wires the pure-Python SequenceMatcher; this
+    yields identical output but lets cdifflib's C matcher do the work when
+    it is installed.
+    """
+    started = False
+    for group in _SequenceMatcher(None, a, b).get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield "+" + line
 
 
 class DiffGeneratorTool(BaseTool):
@@ -493,65 +836,59 @@ class DiffGeneratorTool(BaseTool):
     description: str = "Create unified diffs of old → new content."
 
     def _run(self, old_text: str, new_text: str, file_path: str = "") -> str:
-        old_lines = old_text.splitlines(keepends=True)
-        new_lines = new_text.splitlines(keepends=True)
-        from_file = file_path if file_path else "before"
-        to_file = file_path if file_path else "after"
-
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=from_file,
-            tofile=to_file,
-            lineterm=""
-        )
-        diff_text = "\n".join(diff)
-        return diff_text if diff_text else "No differences found."
+        if old_text == new_text:
+            return "No differences found."
+        # Memoized: agents often re-request the same diff while re-planning.
+        # The cache keeps both texts alive, so oversized inputs bypass it.
+        if len(old_text) + len(new_text) > _MAX_AUDIT_BYTES:
+            return _diff_text(old_text, new_text, file_path)
+        return _cached_diff_text(old_text, new_text, file_path)
+
+
+def _diff_text(old_text: str, new_text: str, file_path: str) -> str:
+    old_lines = old_text.splitlines(keepends=True)
+    new_lines = new_text.splitlines(keepends=True)
+    from_file = file_path if file_path else "before"
+    to_file = file_path if file_path else "after"
+
+    diff = _unified_diff(old_lines, new_lines, from_file, to_file)
+    diff_text = "\n".join(diff)
+    return diff_text if diff_text else "No differences found."
+
+
+_cached_diff_text = functools.lru_cache(maxsize=256)(_diff_text)
 
 
 class SrsParserTool(BaseTool):
     name: str = "SRS Parser"
     description: str = "Parses local SRS markdown files and extracts headings, requirement IDs, and summary text."
 
-    def _run(self, path: str, project_root: str = "") -> Dict[str, Any]:
+    def _run(self, path: str, project_root: str = "") -> str:
+        return _to_json(self._collect(path, project_root))
+
+    def _collect(self, path: str, project_root: str = "") -> Dict[str, Any]:
         abs_path = _get_abs_path(path, project_root)
         if not os.path.exists(abs_path):
             return {"status": "error", "message": f"Path {abs_path} not found."}
 
         md_files = []
         if os.path.isdir(abs_path):
-            for root, dirs, files in os.walk(abs_path):
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                for file in files:
-                    if file.lower().endswith(".md") and not file.startswith('.'):
-                        md_files.append(os.path.join(root, file))
+            md_files = [
+                f_path for f_path, _ in _iter_files(abs_path)
+                if f_path.lower().endswith(".md")
+            ]
         else:
             if not abs_path.lower().endswith(".md"):
                 return {"status": "error", "message": "SRS Parser expects a markdown (.md) file or a directory containing markdown files."}
             md_files = [abs_path]
 
-        results = []
-        req_pattern = re.compile(r"\b([A-Z]{2,}-\d+)\b")
-        for md_file in md_files:
-            content = _safe_read_text(md_file)
-            headings = [line.strip() for line in content.splitlines() if line.strip().startswith("#")]
-            req_ids = list(dict.fromkeys(req_pattern.findall(content)))
-            summary = content[:400].strip().replace("\n", " ")
-            
-            # Normalize path for result
-            display_path = md_file
-            if project_root:
-                try:
-                    display_path = os.path.relpath(md_file, project_root)
-                except Exception:
-                    pass
-
-            results.append({
-                "file": display_path,
-                "headings": headings,
-                "requirement_ids": req_ids,
-                "summary": summary
-            })
+        parse = functools.partial(self._parse_file, project_root=project_root)
+        if len(md_files) > 1:
+            # Overlap the per-file open/mmap I/O; map keeps the input order
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(md_files))) as pool:
+                results = list(pool.map(parse, md_files))
+        else:
+            results = [parse(md_file) for md_file in md_files]
 
         return {
             "status": "ok" if results else "no_srs_found",
@@ -565,20 +902,110 @@ class SrsParserTool(BaseTool):
             "files_parsed": results
         }
 
+    @staticmethod
+    def _parse_file(md_file: str, project_root: str) -> Dict[str, Any]:
+        # Scan the mapped bytes; only headings and the summary get decoded
+        with _mapped(md_file) as mm:
+            headings = [
+                _decode_bytes(h).strip() for h in _MD_HEADING_BYTES_RE.findall(mm)
+            ]
+            # Dedupe the raw matches first so each distinct ID is decoded once
+            req_ids = [
+                r.decode("ascii") for r in dict.fromkeys(_REQ_ID_BYTES_RE.findall(mm))
+            ]
+            # 400 characters need at most 1600 bytes of UTF-8
+            summary = _decode_bytes(mm[:1600], final=False)[:400].strip().replace("\n", " ")
+
+        # Normalize path for result
+        display_path = md_file
+        if project_root:
+            try:
+                display_path = os.path.relpath(md_file, project_root)
+            except Exception:
+                pass
+
+        return {
+            "file": display_path,
+            "headings": headings,
+            "requirement_ids": req_ids,
+            "summary": summary
+        }
+
+
+_GIT_LOG_FORMAT = "%ct|%H|%an|%ad|%s"
+
+# repo_root -> (HEAD commit, {abs file path: history entries}); a new HEAD
+# replaces the repo's entry, so histories never outlive the commit they saw.
+_git_log_cache: Dict[str, Tuple[str, Dict[str, List[Dict[str, Any]]]]] = {}
+
+
+# directory -> enclosing git work tree ("" when there is none)
+_git_root_cache: Dict[str, str] = {}
+
+
+def _git_head(repo_root: str) -> str:
+    """Return the commit HEAD points at, read from .git without running git."""
+    git_dir = os.path.join(repo_root, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[5:]
+        try:
+            with open(os.path.join(git_dir, ref), encoding="utf-8") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            pass
+        with open(os.path.join(git_dir, "packed-refs"), encoding="utf-8") as f:
+            for line in f:
+                sha, _, name = line.strip().partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return ""
+
+
+def _git_history_cache(repo_root: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Per-file history cache for the repo's current HEAD, or None if unknown."""
+    head = _git_head(repo_root)
+    if not head:
+        return None
+    cached = _git_log_cache.get(repo_root)
+    if cached is None or cached[0] != head:
+        cached = (head, {})
+        _git_log_cache[repo_root] = cached
+    return cached[1]
+
+
+def _parse_log_entry(line: str) -> Dict[str, Any]:
+    ts, commit, author, date, subject = line.split("|", 4)
+    return {
+        "timestamp": int(ts),
+        "date": date,
+        "commit": commit,
+        "author": author,
+        "subject": subject
+    }
+
 
 class GitAnalyzerTool(BaseTool):
     name: str = "git_analyzer"
-    description: str = "Gets file modification history and last-changed date using git log."
+    description: str = (
+        "Gets file modification history and last-changed date using git log. "
+        "Pass mode='fast' when only the last-changed date is needed."
+    )
 
-    def _run(self, file_path: str, project_root: str = "") -> Dict[str, Any]:
+    def _run(self, file_path: str, project_root: str = "", mode: str = "full") -> Dict[str, Any]:
         abs_path = _get_abs_path(file_path, project_root)
-        if not os.path.exists(abs_path):
+        st = _safe_stat(abs_path)
+        if st is None:
             return f"Error: File {abs_path} not found."
 
         repo_root = self._find_git_root(os.path.dirname(abs_path))
         if not repo_root:
-            mtime = os.path.getmtime(abs_path)
-            last_changed = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
+            last_changed = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d')
             return {
                 "status": "no_git",
                 "last_changed": last_changed,
@@ -586,43 +1013,135 @@ class GitAnalyzerTool(BaseTool):
                 "message": "No git repository found."
             }
 
+        cache = _git_history_cache(repo_root)
+        key = os.path.abspath(abs_path)
+        entries = cache.get(key) if cache is not None else None
+        if entries is None and mode == "fast":
+            return self._last_changed(repo_root, abs_path)
+        if entries is None:
+            try:
+                log_cmd = [
+                    "git", "-C", repo_root, "log", "-n", "5",
+                    "--date=iso8601",
+                    f"--format={_GIT_LOG_FORMAT}", "--", abs_path
+                ]
+                # Decode the bytes ourselves: text=True would use the locale
+                # codec and newline translation, and fail on non-UTF-8 names
+                output = subprocess.check_output(log_cmd).decode("utf-8", "replace").strip()
+            except subprocess.CalledProcessError as exc:
+                return {"status": "error", "message": f"Error running git log: {exc}"}
+            entries = [_parse_log_entry(line) for line in output.splitlines()]
+            if cache is not None:
+                cache[key] = entries
+
+        if not entries:
+            return {"last_changed": "unknown", "last_updated_iso": None, "history": []}
+
+        last_changed_date = entries[0]["date"][:10]  # Just YYYY-MM-DD
+        return {
+            "last_changed": last_changed_date,
+            "last_updated_iso": last_changed_date,
+            "history": entries
+        }
+
+    @staticmethod
+    def _last_changed(repo_root: str, abs_path: str) -> Dict[str, Any]:
+        # git stops walking history at the first commit touching the file, and
+        # --date=short yields the same day as the full mode's date[:10]
+        log_cmd = [
+            "git", "-C", repo_root, "log", "-1", "--date=short",
+            "--format=%ad", "--", abs_path
+        ]
         try:
-            log_cmd = [
-                "git", "-C", repo_root, "log", "-n", "5",
-                "--date=iso8601",
-                "--format=%ct|%H|%an|%ad|%s", "--", abs_path
-            ]
-            output = subprocess.check_output(log_cmd, text=True).strip()
-            if not output:
-                return {"last_changed": "unknown", "last_updated_iso": None, "history": []}
-
-            entries = []
-            for line in output.splitlines():
-                ts, commit, author, date, subject = line.split("|", 4)
-                entries.append({
-                    "timestamp": int(ts),
-                    "date": date,
-                    "commit": commit,
-                    "author": author,
-                    "subject": subject
-                })
-
-            last_changed_date = entries[0]["date"][:10] if entries else "unknown"  # Just YYYY-MM-DD
-            return {
-                "last_changed": last_changed_date, 
-                "last_updated_iso": last_changed_date,
-                "history": entries
-            }
+            output = subprocess.check_output(log_cmd).decode("utf-8", "replace").strip()
         except subprocess.CalledProcessError as exc:
             return {"status": "error", "message": f"Error running git log: {exc}"}
+        if not output:
+            return {"last_changed": "unknown", "last_updated_iso": None, "history": []}
+        return {"last_changed": output, "last_updated_iso": output, "history": []}
 
     def _find_git_root(self, start_dir: str) -> str:
+        # Every directory visited on the way up resolves to the same root, so
+        # record them all: sibling files then cost one dict lookup, no stats.
+        visited = []
         current = start_dir
+        root = ""
         while current and current != os.path.dirname(current):
+            cached = _git_root_cache.get(current)
+            if cached is not None:
+                root = cached
+                break
+            visited.append(current)
             if os.path.isdir(os.path.join(current, ".git")):
-                return current
+                root = current
+                break
             current = os.path.dirname(current)
-        return ""
+        for d in visited:
+            _git_root_cache[d] = root
+        return root
+
+
+def _umask() -> int:
+    # os.umask can only be read by setting it; done once, at import
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Mode open() would give a new file; _write_text creates files via mkstemp
+_NEW_FILE_MODE = 0o666 & ~_umask()
+
+
+def _write_text(path: str, text: str, durable: bool = False) -> None:
+    """Write text to path without ever leaving a half-written file behind.
+
+    The text goes to a sibling temp file that is then renamed over path
+    (atomic on POSIX and Windows). An existing file keeps its permission
+    bits, and one we may not write raises PermissionError; a new file gets
+    the usual umask-based mode. Symlinks are written through.
+
+    Nothing is fsync'ed unless durable is set: atomicity protects readers
+    either way, and skipping the disk barrier keeps bulk fixes cheap.
+    """
+    target = os.path.realpath(path)
+    directory = os.path.dirname(target) or "."
+    os.makedirs(directory, exist_ok=True)
+    st = _safe_stat(target)
+    if st is None:
+        mode = _NEW_FILE_MODE
+    else:
+        # Renaming over the file needs only a writable directory; refuse when
+        # the file itself is read-only, as an in-place open() would have
+        if not os.access(target, os.W_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), path)
+        mode = stat.S_IMODE(st.st_mode)
+
+    # Hidden name, so a leftover after a crash is skipped by directory walks
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp creates the file 0600 whatever the umask
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    # The new directory entry is only durable once the directory is synced;
+    # Windows cannot open a directory for that and persists renames itself
+    if durable and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 class ApplyFixTool(BaseTool):
@@ -632,14 +1151,15 @@ class ApplyFixTool(BaseTool):
         "Use this tool to actually update documentation files after generating a diff."
     )
 
-    def _run(self, file_path: str, new_content: str) -> str:
-        """Write new_content to file_path, creating dirs if needed."""
+    def _run(self, file_path: str, new_content: str, durable: bool = False) -> str:
+        """Write new_content to file_path, creating dirs if needed.
+
+        With durable, the write is fsync'ed before returning.
+        """
         if not file_path:
             return "Error: file_path is required."
         try:
-            os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            _write_text(file_path, new_content, durable=durable)
             return f"Successfully wrote {len(new_content)} bytes to {file_path}"
         except Exception as exc:
             return f"Error writing to {file_path}: {exc}"
@@ -652,9 +1172,63 @@ class ReadFileTool(BaseTool):
     def _run(self, file_path: str) -> str:
         if not file_path:
             return "Error: file_path is required."
-        if not os.path.exists(file_path):
+        st = _safe_stat(file_path)
+        if st is None:
             return f"Error: File {file_path} not found."
         try:
-            return _safe_read_text(file_path)
+            return _load(file_path, st).source
         except Exception as exc:
             return f"Error reading {file_path}: {exc}"
+
+
+class BatchAuditTool(BaseTool):
+    name: str = "batch_audit"
+    description: str = (
+        "Runs the per-file audit tools for many files at once, in parallel. "
+        ".py files get the docstring, code comment and git checks; README "
+        "files the README check; SRS markdown the SRS parser; every file gets "
+        "git history. Returns results keyed by file, then by tool name."
+    )
+
+    def _run(self, files: List[str], project_root: str = "") -> str:
+        return _to_json(self._collect(files, project_root))
+
+    def _collect(self, files: List[str], project_root: str = "") -> Dict[str, Any]:
+        if not files:
+            return {"status": "error", "message": "files is required."}
+
+        docstring, comments = DocstringSignatureTool(), CodeCommentTool()
+        readme, srs, git = ReadmeStructureTool(), SrsParserTool(), GitAnalyzerTool()
+
+        jobs = []
+        for file_path in files:
+            name = os.path.basename(file_path).lower()
+            if name.endswith(".py"):
+                jobs.append((file_path, docstring))
+                jobs.append((file_path, comments))
+            elif name.endswith(".md") and name.startswith("readme"):
+                jobs.append((file_path, readme))
+            elif name.endswith(".md") and "srs" in name:
+                jobs.append((file_path, srs))
+            jobs.append((file_path, git))
+
+        def run_job(job):
+            file_path, tool = job
+            # Tools that serialize their own output expose the dict as _collect
+            run = getattr(tool, "_collect", tool._run)
+            try:
+                return run(file_path, project_root=project_root)
+            except Exception as exc:
+                return {"status": "error", "message": str(exc)}
+
+        # File reads, regex scans and git subprocesses mostly release the GIL.
+        # Each git_analyzer job runs its own 'git log -n 5 -- <file>': one log
+        # over all the paths would fork less, but git simplifies merge history
+        # differently for a multi-path pathspec and reports other commits.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            outputs = pool.map(run_job, jobs)
+            results: Dict[str, Dict[str, Any]] = {}
+            for (file_path, tool), output in zip(jobs, outputs):
+                results.setdefault(file_path, {})[tool.name] = output
+
+        return {"status": "ok", "files": results}
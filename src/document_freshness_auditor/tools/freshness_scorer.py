@@ -1,7 +1,7 @@
 from typing import Any, Dict, Optional
 from crewai.tools import tool
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date
 
 class FreshnessMetrics(BaseModel):
     doc_type: str = Field(..., description="Type of document (e.g., 'inline_docstring', 'readme', 'api_spec', 'srs', 'documentation')")
@@ -56,9 +56,9 @@ def freshness_scorer(
     recency_factor = 1.0
     if metrics.last_updated_iso and any(c.isdigit() for c in metrics.last_updated_iso):
         try:
-            date_part = metrics.last_updated_iso.split('T')[0]
-            last_update = datetime.fromisoformat(date_part)
-            days_old = (datetime.now() - last_update).days
+            # Day granularity is all the decay needs: compare calendar dates
+            last_update = date.fromisoformat(metrics.last_updated_iso[:10])
+            days_old = (date.today() - last_update).days
             # Linear decay over 300 days, floor at 0.5
             recency_factor = max(0.5, 1.0 - (days_old / 300))
         except (ValueError, TypeError):